@@ -1,19 +1,26 @@
 #!/usr/bin/env python3
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from datetime import datetime
+import sys
+from typing import Annotated
+
+
+Percentage = Annotated[float, Field(ge=0, le=100)]
 
 
 class SpaceStation(BaseModel):
     '''
     Class that represent a space station
     '''
+    model_config = ConfigDict(frozen=True)
+
     station_id: str = Field(min_length=3, max_length=10)
     name: str = Field(min_length=1, max_length=50)
     crew_size: int = Field(ge=1, le=20)
-    power_level: float = Field(ge=0, le=100)
-    oxygen_level: float = Field(ge=0, le=100)
-    last_maintenance: datetime = Field(default_factory=lambda: datetime.now())
+    power_level: Percentage
+    oxygen_level: Percentage
+    last_maintenance: datetime = Field(default_factory=datetime.now)
     is_operational: bool = Field(default=True)
     notes: str | None = Field(default=None, max_length=200)
 
@@ -22,50 +29,55 @@ def display_station(station: SpaceStation) -> None:
     '''
     Display the space station informations
     '''
-    print("ID:", station.station_id)
-    print("Name:", station.name)
-    print("Crew:", station.crew_size)
-    print("Power:", station.power_level)
-    print("Oxygen:", station.oxygen_level)
-    print(f"Status: {'Non ' if station.is_operational else ''}Operational")
+    lines = [
+        f"ID: {station.station_id}",
+        f"Name: {station.name}",
+        f"Crew: {station.crew_size}",
+        f"Power: {station.power_level}",
+        f"Oxygen: {station.oxygen_level}",
+        f"Status: {'Non ' if station.is_operational else ''}Operational"
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+_STATION_SAMPLES = (
+    {
+        "station_id": "ISS001",
+        "name": "International Space Station",
+        "crew_size": 6,
+        "power_level": 85.5,
+        "oxygen_level": 92.3,
+        "is_operational": True
+    },
+    {
+        "station_id": "100SSI",
+        "name": "Station Space International",
+        "crew_size": 25,
+        "power_level": 85.5,
+        "oxygen_level": 92.3,
+        "is_operational": False
+    }
+)
 
 
 def main() -> None:
     '''
     Test the class
     '''
-    print("========================================")
-    try:
-        space_station1 = SpaceStation(
-            station_id="ISS001",
-            name="International Space Station",
-            crew_size=6,
-            power_level=85.5,
-            oxygen_level=92.3,
-            is_operational=True
-        )
-        print("Valid station created:")
-        display_station(space_station1)
-    except ValidationError as e:
-        print("Expected validation error:")
-        print(e.errors()[0]["msg"])
-    print()
-
-    try:
+    for i, data in enumerate(_STATION_SAMPLES):
+        if i != 0:
+            print()
         print("========================================")
-        space_station2 = SpaceStation(
-            station_id="100SSI",
-            name="Station Space International",
-            crew_size=25,
-            power_level=85.5,
-            oxygen_level=92.3,
-            is_operational=False
-        )
-        print("Valid station created:")
-        display_station(space_station2)
-    except ValidationError as e:
-        print("Expected validation error:")
-        print(e.errors()[0]["msg"])
+        try:
+            space_station = SpaceStation.model_validate(data)
+            print("Valid station created:")
+            display_station(space_station)
+        except ValidationError as e:
+            print("Expected validation error:")
+            errors = e.errors(
+                include_url=False, include_context=False, include_input=False
+            )
+            print(errors[0]["msg"])
 
 
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
-from pydantic import BaseModel, Field, ValidationError, model_validator
+from pydantic import (
+    BaseModel, ConfigDict, Field, ValidationError, field_validator,
+    model_validator
+)
 from datetime import datetime
 from enum import Enum
+import sys
 
 
 class ContactType(str, Enum):
@@ -19,8 +23,10 @@ class AlienContact(BaseModel):
     '''
     Class that represent an alien contact
     '''
+    model_config = ConfigDict(frozen=True)
+
     contact_id: str = Field(min_length=5, max_length=15)
-    timestamp: datetime = Field(default_factory=lambda: datetime.now())
+    timestamp: datetime = Field(default_factory=datetime.now)
     location: str = Field(min_length=3, max_length=100)
     contact_type: ContactType
     signal_strength: float = Field(ge=0, le=10)
@@ -29,17 +35,21 @@ class AlienContact(BaseModel):
     message_received: str | None = Field(default=None)
     is_verified: bool = Field(default=False)
 
+    @field_validator("contact_id")
+    @classmethod
+    def check_contact_id(cls, contact_id: str) -> str:
+        if not contact_id.startswith("AC"):
+            raise ValueError("Contact ID must start with 'AC' (Alien Contact)")
+        return contact_id
+
     @model_validator(mode="after")
     def check_model(self):
         error = ""
-        condition1 = not self.is_verified
-        condition2 = self.witness_count < 3
+        contact_type = self.contact_type
 
-        if len(self.contact_id) < 2 or self.contact_id[:2] != "AC":
-            error = "Contact ID must start with 'AC' (Alien Contact)"
-        elif self.contact_type == ContactType.physical and condition1:
+        if contact_type == ContactType.physical and not self.is_verified:
             error = "physical contact reports must be verified"
-        elif self.contact_type == ContactType.telepathic and condition2:
+        elif contact_type == ContactType.telepathic and self.witness_count < 3:
             error = "telepathic contact requires at least 3 witnesses"
         elif self.signal_strength > 7 and self.message_received is None:
             error = "Strong signals (> 7.0) should include received messages"
@@ -50,81 +60,86 @@ class AlienContact(BaseModel):
         return self
 
 
+_DURATION_FORMATS = {
+    (0, 0): "",
+    (0, 1): "%(minutes)d minute",
+    (0, 2): "%(minutes)d minutes",
+    (1, 0): "%(hours)d hour",
+    (1, 1): "%(hours)d hour %(minutes)d minute",
+    (1, 2): "%(hours)d hour %(minutes)d minutes",
+    (2, 0): "%(hours)d hours",
+    (2, 1): "%(hours)d hours %(minutes)d minute",
+    (2, 2): "%(hours)d hours %(minutes)d minutes",
+}
+
+
 def convert_duration(duration: int) -> str:
     '''
     Convert a minutes duration into an hour and minutes duration
     '''
-    res = ""
-    if duration >= 60:
-        plurial = ""
-        if duration >= 120:
-            plurial = "s"
-        res += f"{duration // 60} hour{plurial}"
-        if duration % 60 != 0:
-            res += " "
-    if duration % 60 == 0:
-        return res
-
-    plurial = ""
-    if duration % 60 != 1:
-        plurial = "s"
-    res += f"{duration % 60} minute{plurial}"
-
-    return res
+    hours, minutes = divmod(duration, 60)
+    key = (max(0, min(hours, 2)), max(0, min(minutes, 2)))
+    fmt = _DURATION_FORMATS[key]
+    return fmt % {"hours": hours, "minutes": minutes}
 
 
 def display_contact(contact: AlienContact) -> None:
     '''
     Display the alien contact informations
     '''
-    print("ID:", contact.contact_id)
-    print("Type:", contact.contact_type)
-    print("Location:", contact.location)
-    print(f"Signal: {round(contact.signal_strength, 1)}/10")
-    print("Duration:", convert_duration(contact.duration_minutes))
-    print("Witness:", contact.witness_count)
+    lines = [
+        f"ID: {contact.contact_id}",
+        f"Type: {contact.contact_type!s}",
+        f"Location: {contact.location}",
+        f"Signal: {round(contact.signal_strength, 1)}/10",
+        f"Duration: {convert_duration(contact.duration_minutes)}",
+        f"Witness: {contact.witness_count}"
+    ]
     if contact.message_received is not None:
-        print(f"Message: '{contact.message_received}'")
+        lines.append(f"Message: '{contact.message_received}'")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+_CONTACT_SAMPLES = (
+    {
+        "contact_id": "AC_2024_001",
+        "contact_type": ContactType.radio,
+        "location": "Area 51, Nevada",
+        "signal_strength": 8.5,
+        "duration_minutes": 45,
+        "witness_count": 5,
+        "message_received": "Greetings from Zeta Reticuli"
+    },
+    {
+        "contact_id": "AC_2471_PEP",
+        "contact_type": ContactType.telepathic,
+        "location": "Area 42, Lyon",
+        "signal_strength": 4.2,
+        "duration_minutes": 42,
+        "witness_count": 1,
+        "message_received": "Greetings from CRAPPO the First"
+    }
+)
 
 
 def main() -> None:
     '''
     Test the class
     '''
-    print("========================================")
-    try:
-        alien_contact1 = AlienContact(
-            contact_id="AC_2024_001",
-            contact_type=ContactType.radio,
-            location="Area 51, Nevada",
-            signal_strength=8.5,
-            duration_minutes=45,
-            witness_count=5,
-            message_received="Greetings from Zeta Reticuli"
-        )
-        print("Valid contact report:")
-        display_contact(alien_contact1)
-    except ValidationError as e:
-        print("Expected validation error:")
-        print(e.errors()[0]["msg"][13:])
-    print()
-
-    try:
+    for i, data in enumerate(_CONTACT_SAMPLES):
+        if i != 0:
+            print()
         print("========================================")
-        alien_contact2 = AlienContact(
-            contact_id="AC_2471_PEP",
-            contact_type=ContactType.telepathic,
-            location="Area 42, Lyon",
-            signal_strength=4.2,
-            duration_minutes=42,
-            witness_count=1,
-            message_received="Greetings from CRAPPO the First"
-        )
-        print("Valid contact report:")
-        display_contact(alien_contact2)
-    except ValidationError as e:
-        print("Expected validation error:")
-        print(e.errors()[0]["msg"][13:])
+        try:
+            alien_contact = AlienContact.model_validate(data)
+            print("Valid contact report:")
+            display_contact(alien_contact)
+        except ValidationError as e:
+            print("Expected validation error:")
+            errors = e.errors(
+                include_url=False, include_context=False, include_input=False
+            )
+            print(errors[0]["msg"].removeprefix("Value error, "))
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 
-from pydantic import BaseModel, Field, ValidationError, model_validator
+from pydantic import (
+    BaseModel, ConfigDict, Field, ValidationError, field_validator,
+    model_validator
+)
 from datetime import datetime
 from enum import Enum
-from typing import List
+import sys
+from typing import Annotated, Sequence, Tuple
 
 
 class Rank(str, Enum):
@@ -21,6 +25,8 @@ class CrewMember(BaseModel):
     '''
     Class that represent a person in the crew
     '''
+    model_config = ConfigDict(frozen=True)
+
     member_id: str = Field(min_length=3, max_length=10)
     name: str = Field(min_length=2, max_length=50)
     rank: Rank
@@ -30,66 +36,66 @@ class CrewMember(BaseModel):
     is_active: bool = Field(default=True)
 
 
-def not_min_rank(crew: List[CrewMember]) -> bool:
-    '''
-    Return True if there are no Commander or Captain in the crew, else False
-    '''
-    nb_commander, nb_captain = 0, 0
-    for person in crew:
-        if person.rank == Rank.commander:
-            nb_commander += 1
-        elif person.rank == Rank.captain:
-            nb_captain += 1
-
-    return nb_commander == 0 and nb_captain == 0
+CrewList = Annotated[
+    Tuple[CrewMember, ...], Field(min_length=1, max_length=12)
+]
 
 
-def active_crew(crew: List[CrewMember]) -> bool:
+def scan_crew(crew: Sequence[CrewMember]) -> Tuple[bool, bool, int]:
     '''
-    Return True if all the crew is active, else False
+    Scan the crew once and return a tuple with:
+    - True if there is at least one Commander or Captain, else False
+    - True if all the crew is active, else False
+    - the number of experienced members (more than 5 years)
     '''
+    commander, captain = Rank.commander, Rank.captain
+    has_command, all_active, nb_experience = False, True, 0
     for person in crew:
+        rank = person.rank
+        if rank == commander or rank == captain:
+            has_command = True
         if not person.is_active:
-            return False
-    return True
-
-
-def experience_crew(crew: List[CrewMember]) -> bool:
-    '''
-    Return True if all the crew is experience
-    '''
-    nb_experience = 0
-    for person in crew:
+            all_active = False
         if person.years_experience > 5:
             nb_experience += 1
-    return nb_experience >= len(crew) / 2
+
+    return has_command, all_active, nb_experience
 
 
 class SpaceMission(BaseModel):
     '''
     Class that represent a space misson
     '''
+    model_config = ConfigDict(frozen=True)
+
     mission_id: str = Field(min_length=5, max_length=15)
     mission_name: str = Field(min_length=3, max_length=100)
     destination: str = Field(min_length=3, max_length=50)
-    lauch_date: datetime = Field(default_factory=lambda: datetime.now())
+    lauch_date: datetime = Field(default_factory=datetime.now)
     duration_days: int = Field(ge=1, le=3650)
-    crew: List[CrewMember] = Field(min_length=1, max_length=12)
+    crew: CrewList
     mission_status: str = Field(default="planned")
     budget_millions: float = Field(ge=1, le=10000)
 
+    @field_validator("mission_id")
+    @classmethod
+    def check_mission_id(cls, mission_id: str) -> str:
+        if not mission_id.startswith("M"):
+            raise ValueError("Mission ID must start with 'M'")
+        return mission_id
+
     @model_validator(mode="after")
     def check_model(self):
         error = ""
+        has_command, all_active, nb_experience = scan_crew(self.crew)
+        experienced = nb_experience >= len(self.crew) / 2
 
-        if len(self.mission_id) == 0 or self.mission_id[0] != "M":
-            error = "Mission ID must start with 'M'"
-        elif not_min_rank(self.crew):
+        if not has_command:
             error = "Must have at least one Commander or Captain"
-        elif self.duration_days > 365 and not experience_crew(self.crew):
+        elif self.duration_days > 365 and not experienced:
             error = "Long missions (> 365 days) "
             error += "need 50% experienced crew (5+ years)"
-        elif not active_crew(self.crew):
+        elif not all_active:
             error = "All crew members must be active"
 
         if error != "":
@@ -102,105 +108,111 @@ def display_mission(mission: SpaceMission) -> None:
     '''
     Display the space mission informations
     '''
-    print("Mission:", mission.mission_name)
-    print("ID:", mission.mission_id)
-    print("Destination:", mission.destination)
     plurial = "s" if mission.duration_days > 1 else ""
-    print(f"Duration: {mission.duration_days} day{plurial}")
-    print(f"Budget: ${round(mission.budget_millions, 2)}M")
-    print("Crew size:", len(mission.crew))
-
-    print("Crew members:")
+    lines = [
+        f"Mission: {mission.mission_name}",
+        f"ID: {mission.mission_id}",
+        f"Destination: {mission.destination}",
+        f"Duration: {mission.duration_days} day{plurial}",
+        f"Budget: ${round(mission.budget_millions, 2)}M",
+        f"Crew size: {len(mission.crew)}",
+        "Crew members:"
+    ]
     for person in mission.crew:
-        print(f"- {person.name} ({person.rank}) - {person.specialization}")
+        lines.append(
+            f"- {person.name} ({person.rank!s}) - {person.specialization}"
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+_MISSION_SAMPLES = (
+    {
+        "mission_id": "M2024_MARS",
+        "mission_name": "Mars Colony Establishment",
+        "destination": "Mars",
+        "duration_days": 900,
+        "budget_millions": 2500.0,
+        "crew": [
+            {
+                "member_id": "Person005",
+                "name": "Sarah Connor",
+                "rank": Rank.commander,
+                "specialization": "Mission Command",
+                "age": 37,
+                "years_experience": 5
+            },
+            {
+                "member_id": "Person006",
+                "name": "John Smith",
+                "rank": Rank.lieutenant,
+                "specialization": "Navigation",
+                "age": 63,
+                "years_experience": 17
+            },
+            {
+                "member_id": "Person007",
+                "name": "Alice Johnson",
+                "rank": Rank.officer,
+                "specialization": "Engineering",
+                "age": 58,
+                "years_experience": 20
+            }
+        ]
+    },
+    {
+        "mission_id": "M2026_MARS",
+        "mission_name": "Mars Colony Establishment",
+        "destination": "Mars",
+        "duration_days": 900,
+        "budget_millions": 2500.0,
+        "crew": [
+            {
+                "member_id": "Person005",
+                "name": "Sarah Connor",
+                "rank": Rank.cadet,
+                "specialization": "Mission Command",
+                "age": 37,
+                "years_experience": 5
+            },
+            {
+                "member_id": "Person006",
+                "name": "John Smith",
+                "rank": Rank.lieutenant,
+                "specialization": "Navigation",
+                "age": 63,
+                "years_experience": 17
+            },
+            {
+                "member_id": "Person007",
+                "name": "Alice Johnson",
+                "rank": Rank.officer,
+                "specialization": "Engineering",
+                "age": 58,
+                "years_experience": 21
+            }
+        ]
+    }
+)
 
 
 def main() -> None:
     '''
     Test the class
     '''
-    print("========================================")
-    try:
-        space_mission1 = SpaceMission(
-            mission_id="M2024_MARS",
-            mission_name="Mars Colony Establishment",
-            destination="Mars",
-            duration_days=900,
-            budget_millions=2500.0,
-            crew=[
-                CrewMember(
-                    member_id="Person005",
-                    name="Sarah Connor",
-                    rank=Rank.commander,
-                    specialization="Mission Command",
-                    age=37,
-                    years_experience=5
-                ),
-                CrewMember(
-                    member_id="Person006",
-                    name="John Smith",
-                    rank=Rank.lieutenant,
-                    specialization="Navigation",
-                    age=63,
-                    years_experience=17
-                ),
-                CrewMember(
-                    member_id="Person007",
-                    name="Alice Johnson",
-                    rank=Rank.officer,
-                    specialization="Engineering",
-                    age=58,
-                    years_experience=20
-                )
-            ]
-        )
-        print("Valid mission created:")
-        display_mission(space_mission1)
-    except ValidationError as e:
-        print("Expected validation error:")
-        print(e.errors()[0]["msg"][13:])
-    print()
-
-    try:
+    for i, data in enumerate(_MISSION_SAMPLES):
+        if i != 0:
+            print()
         print("========================================")
-        space_mission2 = SpaceMission(
-            mission_id="M2026_MARS",
-            mission_name="Mars Colony Establishment",
-            destination="Mars",
-            duration_days=900,
-            budget_millions=2500.0,
-            crew=[
-                CrewMember(
-                    member_id="Person005",
-                    name="Sarah Connor",
-                    rank=Rank.cadet,
-                    specialization="Mission Command",
-                    age=37,
-                    years_experience=5
-                ),
-                CrewMember(
-                    member_id="Person006",
-                    name="John Smith",
-                    rank=Rank.lieutenant,
-                    specialization="Navigation",
-                    age=63,
-                    years_experience=17
-                ),
-                CrewMember(
-                    member_id="Person007",
-                    name="Alice Johnson",
-                    rank=Rank.officer,
-                    specialization="Engineering",
-                    age=58,
-                    years_experience=21
-                )
-            ]
-        )
-        print("Valid mission created:")
-        display_mission(space_mission2)
-    except ValidationError as e:
-        print("Expected validation error:")
-        print(e.errors()[0]["msg"][13:])
+        try:
+            space_mission = SpaceMission.model_validate(data)
+            print("Valid mission created:")
+            display_mission(space_mission)
+        except ValidationError as e:
+            print("Expected validation error:")
+            errors = e.errors(
+                include_url=False, include_context=False, include_input=False
+            )
+            print(errors[0]["msg"].removeprefix("Value error, "))
 
 
 if __name__ == "__main__":